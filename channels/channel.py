@@ -5,8 +5,8 @@ __all__ = ["Channel"]
 import asyncio
 from asyncio import Future
 from collections import deque as Deque
-from collections.abc import AsyncIterator, Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator
+from contextlib import closing
 from typing import Optional, Self, final
 
 from . import stream
@@ -47,12 +47,13 @@ class Channel[T]:
     @property
     def full(self) -> bool:
         """The channel's full state"""
-        return self.size == self.max_size
+        buffer = self._buffer
+        return len(buffer) == buffer.maxlen
 
     @property
     def empty(self) -> bool:
         """The channel's empty state"""
-        return not self.size
+        return not self._buffer
 
     @property
     def closed(self) -> bool:
@@ -89,15 +90,44 @@ class Channel[T]:
             if self._receiver is not None:
                 raise RuntimeError("channel is already receiving")
         buffer = self._buffer
-        while not buffer:
-            receiver = asyncio.get_running_loop().create_future()
-            self._receiver = receiver
-            try:
-                await receiver
-            finally:
-                self._receiver = None
+        if not buffer:
+            create_future = asyncio.get_running_loop().create_future
+            while not buffer:
+                receiver = create_future()
+                self._receiver = receiver
+                try:
+                    await receiver
+                finally:
+                    self._receiver = None
         return buffer.popleft()
 
+    async def recv_many(self, bound: Optional[int] = None) -> list[T]:
+        """Receive up to ``bound`` values from the channel
+
+        Waits for the first value as ``recv()`` does, then takes any further
+        values that are immediately available without waiting again. If
+        ``bound`` is ``None``, takes every value in the channel buffer.
+
+        Negative values for ``bound`` are treated equivalently to 0.
+
+        Raises ``Closure`` and ``RuntimeError`` under the same conditions as
+        ``recv()``.
+        """
+        if self._closed:
+            raise Closure
+        if __debug__:
+            if self._receiver is not None:
+                raise RuntimeError("channel is already receiving")
+        if bound is not None and bound <= 0:
+            return []
+        values = [await self.recv()]
+        buffer = self._buffer
+        count = len(buffer)
+        if bound is not None:
+            count = min(count, bound - 1)
+        values.extend(buffer.popleft() for _ in range(count))
+        return values
+
     def open(self) -> Self:
         """Open the channel"""
         self._closed = False
@@ -122,12 +152,8 @@ class Channel[T]:
         self._buffer.clear()
         return self
 
-    @contextmanager
-    def closure(self) -> Iterator[Self]:
+    def closure(self) -> closing[Self]:
         """Return a context manager that ensures the channel's closure upon
         exit
         """
-        try:
-            yield self
-        finally:
-            self.close()
+        return closing(self)
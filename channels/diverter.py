@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-__all__ = ["Diverter"]
+__all__ = [
+    "Diverter",
+    "Attachment",
+]
 
-import uuid
+import itertools
 from collections.abc import Iterator, Mapping
-from contextlib import contextmanager
-from typing import Optional, Self
-from uuid import UUID
+from contextlib import closing
+from types import TracebackType
+from typing import Optional, Self, final
 
 from .channel import Channel
 from .exceptions import Closure
@@ -14,23 +17,28 @@ from .exceptions import Closure
 
 class Diverter[T]:
 
-    __slots__ = ("_channels")
-    _channels: dict[UUID, Channel[T]]
+    __slots__ = ("_channels", "_tokens")
+    _channels: dict[int, Channel[T]]
+    _tokens: Iterator[int]
 
     def __init__(self) -> None:
         self._channels = {}
+        self._tokens = itertools.count()
 
-    def channels(self) -> Mapping[UUID, Channel[T]]:
+    def channels(self) -> Mapping[int, Channel[T]]:
         """Return a view of the currently-attached channels"""
         return self._channels
 
-    def attach(self, channel: Channel[T]) -> UUID:
-        """Attach ``channel`` and return its assigned token"""
-        token = uuid.uuid4()
+    def attach(self, channel: Channel[T]) -> int:
+        """Attach ``channel`` and return its assigned token
+
+        Tokens are unique among the channels attached to this diverter.
+        """
+        token = next(self._tokens)
         self._channels[token] = channel
         return token
 
-    def detach(self, token: UUID) -> bool:
+    def detach(self, token: int) -> bool:
         """Detach the channel assigned to ``token``, returning true if a
         corresponding channel was found, otherwise false
         """
@@ -41,8 +49,7 @@ class Diverter[T]:
         else:
             return True
 
-    @contextmanager
-    def attachment(self, channel: Optional[Channel[T]] = None) -> Iterator[Channel[T]]:
+    def attachment(self, channel: Optional[Channel[T]] = None) -> Attachment[T]:
         """Return a context manager that safely attaches and detaches
         ``channel``
 
@@ -50,11 +57,7 @@ class Diverter[T]:
         """
         if channel is None:
             channel = Channel()
-        token = self.attach(channel)
-        try:
-            yield channel
-        finally:
-            self.detach(token)
+        return Attachment(self, channel)
 
     def send(self, value: T, /) -> None:
         """Send a value to all attached channels
@@ -62,34 +65,68 @@ class Diverter[T]:
         Channels that are closed but still attached at the moment of sending
         are detached.
         """
-        tokens = []
-        for token, channel in self.channels().items():
+        tokens: Optional[list[int]] = None  # Allocated on first closure only
+        for token, channel in self._channels.items():
             try:
                 channel.send(value)
             except Closure:
-                tokens.append(token)
-        for token in tokens:
-            self.detach(token)
+                if tokens is None:
+                    tokens = [token]
+                else:
+                    tokens.append(token)
+        if tokens is not None:
+            detach = self.detach
+            for token in tokens:
+                detach(token)
 
     def close(self) -> None:
         """Close and detach all attached channels"""
-        tokens = list(self.channels())
-        for channel in self.channels().values():
+        channels = self._channels
+        for channel in channels.values():
             channel.close()
-        for token in tokens:
-            self.detach(token)
+        channels.clear()
 
     def clear(self) -> None:
         """Clear all attached channels"""
-        for channel in self.channels().values():
+        for channel in self._channels.values():
             channel.clear()
 
-    @contextmanager
-    def closure(self) -> Iterator[Self]:
+    def closure(self) -> closing[Self]:
         """Return a context manager that ensures the diverter's closure upon
         exit
         """
-        try:
-            yield self
-        finally:
-            self.close()
+        return closing(self)
+
+
+@final
+class Attachment[T]:
+    """A context manager that attaches a channel to a diverter upon entry,
+    and detaches it upon exit
+    """
+
+    __slots__ = ("_diverter", "_channel", "_token")
+    _diverter: Diverter[T]
+    _channel: Channel[T]
+    _token: Optional[int]
+
+    def __init__(self, diverter: Diverter[T], channel: Channel[T]) -> None:
+        self._diverter = diverter
+        self._channel = channel
+        self._token = None
+
+    def __enter__(self) -> Channel[T]:
+        if self._token is not None:
+            raise RuntimeError("attachment is already entered")
+        self._token = self._diverter.attach(self._channel)
+        return self._channel
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        token = self._token
+        if token is not None:
+            self._token = None
+            self._diverter.detach(token)
@@ -9,10 +9,10 @@ __all__ = [
 
 import asyncio
 import logging
-from asyncio import Task
-from asyncio import TimeoutError as AsyncTimeoutError
+import operator
+from asyncio import Future
 from collections import deque as Deque
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, Optional, Self, TypeGuard, final, overload
 
 
@@ -46,7 +46,7 @@ class Stream[T](AsyncIterator[T]):
     operations and waiting utilities
     """
 
-    __slots__ = ("_values")
+    __slots__ = ("_values",)
     _values: AsyncIterator[T]
 
     def __init__(self, values: AsyncIterator[T], /) -> None:
@@ -55,9 +55,8 @@ class Stream[T](AsyncIterator[T]):
     def __aiter__(self) -> Self:
         return self
 
-    async def __anext__(self) -> T:
-        value = await anext(self._values)
-        return value
+    def __anext__(self) -> Awaitable[T]:
+        return self._values.__anext__()
 
     @compose
     async def finite_timeout(self, delay: float, *, first: bool = True) -> AsyncIterator[T]:
@@ -70,8 +69,10 @@ class Stream[T](AsyncIterator[T]):
             if not first:
                 yield await anext(self)
             while True:
-                yield await asyncio.wait_for(anext(self), delay)
-        except (StopAsyncIteration, AsyncTimeoutError):
+                async with asyncio.timeout(delay):
+                    value = await anext(self)
+                yield value
+        except (StopAsyncIteration, TimeoutError):
             return
 
     def timeout(self, delay: Optional[float], *, first: bool = True) -> Stream[T]:
@@ -92,10 +93,12 @@ class Stream[T](AsyncIterator[T]):
         among all encountered values
         """
         seen = set[object]()
+        add = seen.add
+        size = 0
         async for value in self:
-            result = key(value)
-            if result not in seen:
-                seen.add(result)
+            add(key(value))  # Hashes once, versus an "in" test followed by add()
+            if len(seen) != size:
+                size += 1
                 yield value
 
     @compose
@@ -103,7 +106,20 @@ class Stream[T](AsyncIterator[T]):
         """Return a sub-stream of the values whose call to ``key`` is unique
         as compared to the previously encountered value
         """
-        seen = object()
+        try:
+            value = await anext(self)
+        except StopAsyncIteration:
+            return
+        if key is identity:  # Skips a call per value in the common case
+            previous = value
+            yield value
+            async for value in self:
+                if value != previous:
+                    previous = value
+                    yield value
+            return
+        seen = key(value)
+        yield value
         async for value in self:
             result = key(value)
             if result != seen:
@@ -126,18 +142,38 @@ class Stream[T](AsyncIterator[T]):
         """
         if bound <= 0:
             return
-        async for count, value in self.enumerate(1):
+        remaining = bound
+        async for value in self:
             yield value
-            if count == bound:
+            remaining -= 1
+            if not remaining:
                 return
 
     @compose
-    async def map[S](self, mapper: Callable[[T], S]) -> AsyncIterator[S]:
+    async def chunk(self, size: int) -> AsyncIterator[list[T]]:
+        """Return a sub-stream of the values grouped into lists of ``size``
+
+        A list shorter than ``size`` is only yielded once the stream has been
+        exhausted, such that values are held for as long as an unexhausted
+        stream is idle.
+
+        Values of ``size`` less than 1 are treated equivalently to 1.
+        """
+        size = max(size, 1)
+        values = list[T]()
+        async for value in self:
+            values.append(value)
+            if len(values) == size:
+                yield values
+                values = list[T]()
+        if values:
+            yield values
+
+    def map[S](self, mapper: Callable[[T], S]) -> Stream[S]:
         """Return a sub-stream of the results from passing each value to
         ``mapper``
         """
-        async for value in self:
-            yield mapper(value)
+        return Stream(Pipeline.of(self._values, MAP, mapper))
 
     @overload
     def zip(self) -> Stream[tuple[T]]: ...
@@ -157,33 +193,32 @@ class Stream[T](AsyncIterator[T]):
 
         Iteration stops when the shortest stream has been exhausted.
         """
-        streams = (self, *others)
+        if not others:  # Nothing to await concurrently
+            async for value in self:
+                yield (value,)
+            return
+        steps = tuple(stream.__anext__ for stream in (self, *others))
         try:
             while True:
-                yield tuple(await asyncio.gather(*map(anext, streams)))
+                yield tuple(await asyncio.gather(*[step() for step in steps]))
         except StopAsyncIteration:
             return
 
-    @compose
-    async def star_map[*Ts, S](self: Stream[tuple[*Ts]], mapper: Callable[[*Ts], S]) -> AsyncIterator[S]:
+    def star_map[*Ts, S](self: Stream[tuple[*Ts]], mapper: Callable[[*Ts], S]) -> Stream[S]:
         """Return a sub-stream of the results from unpacking and passing each
         value to ``mapper``
         """
-        async for values in self:
-            yield mapper(*values)
+        return Stream(Pipeline.of(self._values, STAR_MAP, mapper))
 
     @overload
     def filter[S](self, predicate: Callable[[T], TypeGuard[S]]) -> Stream[S]: ...
     @overload
     def filter(self, predicate: Callable[[T], object]) -> Stream[T]: ...
-    @compose
-    async def filter(self, predicate: Callable[[T], object]) -> AsyncIterator[T]:
+    def filter(self, predicate: Callable[[T], object]) -> Stream[Any]:
         """Return a sub-stream of the values whose call to ``predicate``
         evaluates true
         """
-        async for value in self:
-            if predicate(value):
-                yield value
+        return Stream(Pipeline.of(self._values, FILTER, predicate))
 
     @overload
     def chain(self) -> Stream[T]: ...
@@ -208,11 +243,11 @@ class Stream[T](AsyncIterator[T]):
 
     def truthy(self) -> Stream[T]:
         """Return a sub-stream of the values filtered by their truthyness"""
-        return self.filter(lambda value: value)
+        return self.filter(bool)
 
     def falsy(self) -> Stream[T]:
         """Return a sub-stream of the values filtered by their falsyness"""
-        return self.filter(lambda value: not value)
+        return self.filter(operator.not_)
 
     def not_none[S](self: Stream[Optional[S]]) -> Stream[S]:
         """Return a sub-stream of the values that are not ``None``"""
@@ -220,18 +255,21 @@ class Stream[T](AsyncIterator[T]):
 
     async def all(self) -> bool:
         """Return true if all values are true, otherwise false"""
-        return bool(await self.falsy().next(default=True))
+        async for value in self:
+            if not value:
+                return False
+        return True
 
     async def any(self) -> bool:
         """Return true if any value is true, otherwise false"""
-        return bool(await self.truthy().next(default=False))
+        async for value in self:
+            if value:
+                return True
+        return False
 
     async def collect(self) -> list[T]:
         """Return the values accumulated as a ``list``"""
-        result = list[T]()
-        async for value in self:
-            result.append(value)
-        return result
+        return [value async for value in self]
 
     async def reduce[S](self, initial: S, reducer: Callable[[S, T], S]) -> S:
         """Return the values accumulated as one via left-fold"""
@@ -242,7 +280,10 @@ class Stream[T](AsyncIterator[T]):
 
     async def count(self) -> int:
         """Return the number of values"""
-        return await self.reduce(0, lambda count, _: count + 1)
+        count = 0
+        async for _ in self:
+            count += 1
+        return count
 
     async def next[DefaultT](self, *, default: DefaultT = None) -> T | DefaultT:
         """Return the next value of the stream, or ``default`` if the stream is
@@ -256,6 +297,78 @@ class Stream[T](AsyncIterator[T]):
             ...
 
 
+MAP, STAR_MAP, FILTER = range(3)
+
+
+@final
+class Pipeline[T](AsyncIterator[T]):
+    """An asynchronous iterator that passes the values of another through a
+    sequence of map, star-map, and filter stages
+
+    Chained ``Stream.map()``, ``Stream.star_map()`` and ``Stream.filter()``
+    calls are fused into a single ``Pipeline``, such that each value is
+    retrieved with one ``await`` regardless of the number of stages.
+
+    Each pipeline keeps the pipelines it was fused from, the i-th of which owns
+    the i-th stage. When the source or a stage raises, the pipeline owning the
+    failing stage is exhausted along with every pipeline fused from it, as the
+    asynchronous generator raising it and every generator consuming it would
+    have been before fusion.
+    """
+
+    __slots__ = ("_values", "_stages", "_parents")
+    _values: Optional[AsyncIterator[Any]]
+    _stages: tuple[tuple[int, Callable[..., Any]], ...]
+    _parents: tuple[Pipeline[Any], ...]
+
+    def __init__(self, values: Optional[AsyncIterator[Any]], stages: tuple[tuple[int, Callable[..., Any]], ...], parents: tuple[Pipeline[Any], ...] = (), /) -> None:
+        self._values = values
+        self._stages = stages
+        self._parents = parents
+
+    @classmethod
+    def of(cls, values: AsyncIterator[Any], kind: int, func: Callable[..., Any], /) -> Pipeline[Any]:
+        """Return a pipeline that applies a stage to ``values``
+
+        If ``values`` is itself a pipeline, its stages are extended rather than
+        nested.
+        """
+        if type(values) is cls:
+            return cls(values._values, (*values._stages, (kind, func)), (*values._parents, values))
+        return cls(values, ((kind, func),))
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> T:
+        values = self._values
+        if values is None:
+            raise StopAsyncIteration
+        for parent in self._parents:
+            if parent._values is None:  # Exhausted while iterated directly
+                self._values = None
+                raise StopAsyncIteration
+        stages = self._stages
+        try:
+            while True:
+                index = 0
+                value = await anext(values)
+                for kind, func in stages:
+                    if kind == MAP:
+                        value = func(value)
+                    elif kind == STAR_MAP:
+                        value = func(*value)
+                    elif not func(value):
+                        break
+                    index += 1
+                else:
+                    return value
+        except BaseException:
+            for pipeline in (*self._parents, self)[index:]:
+                pipeline._values = None
+            raise
+
+
 @final
 class Merger[T]:
     """An asynchronous iterable that "merges" the results of multiple
@@ -265,21 +378,24 @@ class Merger[T]:
     ``add()`` method. See its documentation for more details.
     """
 
-    __slots__ = ("_suppress_exceptions", "_streams")
+    __slots__ = ("_suppress_exceptions", "_streams", "_wake")
     _suppress_exceptions: bool
     _streams: Deque[Stream[T]]
+    _wake: Optional[Future[None]]
 
     def __init__(self, *, suppress_exceptions: bool = False) -> None:
         self._suppress_exceptions = suppress_exceptions
         self._streams = Deque()
+        self._wake = None
 
     @compose
     async def __aiter__(self) -> AsyncIterator[T]:
-        done = dict[Task[T], Stream[T]]()
-        todo = dict[Task[T], Stream[T]]()
-        wake = asyncio.get_running_loop().create_future()
+        done = dict[Future[T], Stream[T]]()
+        todo = dict[Future[T], Stream[T]]()
+        create_future = asyncio.get_running_loop().create_future
+        wake = create_future()
 
-        def todo_to_done(task: Task[T]) -> None:
+        def todo_to_done(task: Future[T]) -> None:
             done[task] = todo.pop(task)
             if not wake.done():
                 wake.set_result(None)
@@ -302,7 +418,7 @@ class Merger[T]:
 
             while streams:
                 stream = streams.popleft()
-                task = asyncio.create_task(anext(stream))
+                task: Future[T] = asyncio.ensure_future(anext(stream))
                 todo[task] = stream
                 task.add_done_callback(todo_to_done)
 
@@ -317,8 +433,16 @@ class Merger[T]:
             if not (todo or done):
                 return
 
-            await wake
-            wake = asyncio.get_running_loop().create_future()
+            # The wake future is exposed while waiting so that add() can
+            # interrupt the wait to schedule its stream immediately, rather
+            # than upon the next yield of an existing stream.
+
+            self._wake = wake
+            try:
+                await wake
+            finally:
+                self._wake = None
+            wake = create_future()
 
             while done:
                 task, stream = done.popitem()
@@ -351,6 +475,9 @@ class Merger[T]:
         time are synchronously yielded.
         """
         self._streams.append(stream)
+        wake = self._wake
+        if not (wake is None or wake.done()):
+            wake.set_result(None)
 
 
 @overload